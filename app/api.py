@@ -0,0 +1,89 @@
+from typing import Any, Iterable, Iterator, Optional
+
+import msgspec
+from fastapi import APIRouter, HTTPException, Query
+from nicegui import app
+from starlette.responses import JSONResponse, StreamingResponse
+
+from app import bootcamp_service
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSONResponse rendered by msgspec: Structs, datetimes, dicts and lists in a single C pass
+
+    Endpoints return it explicitly; returning a bare Struct would send it through jsonable_encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+def _json_array_chunks(items: Iterable[msgspec.Struct]) -> Iterator[bytes]:
+    separator = b"["
+    for item in items:
+        yield separator + _encoder.encode(item)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def _json_stream(items: Iterable[msgspec.Struct]) -> StreamingResponse:
+    """A JSON array written item by item, for exports too large to build in memory"""
+    return StreamingResponse(_json_array_chunks(items), media_type="application/json")
+
+
+def _check_cursor(after_order: Optional[int], after_id: Optional[int]) -> None:
+    if (after_order is None) != (after_id is None):
+        raise HTTPException(status_code=422, detail="after_order and after_id must be given together")
+
+
+# NiceGUI's app-wide 404 handler renders HTML, so API misses are returned rather than raised
+def create():
+    """Read-only JSON API over the generated bootcamps"""
+    router = APIRouter(prefix="/api", default_response_class=MsgspecJSONResponse)
+
+    @router.get("/bootcamps")
+    def list_bootcamps(tag: Optional[str] = None) -> MsgspecJSONResponse:
+        return MsgspecJSONResponse(bootcamp_service.list_bootcamps(tag))
+
+    @router.get("/bootcamps/{bootcamp_id}")
+    def get_bootcamp(bootcamp_id: int) -> MsgspecJSONResponse:
+        bootcamp = bootcamp_service.get_bootcamp(bootcamp_id)
+        if bootcamp is None:
+            return MsgspecJSONResponse({"detail": "Bootcamp not found"}, status_code=404)
+        return MsgspecJSONResponse(bootcamp)
+
+    # child listings are keyset-paginated: pass the previous page's next_cursor back as after_order + after_id
+    @router.get("/bootcamps/{bootcamp_id}/courses")
+    def list_courses(
+        bootcamp_id: int,
+        after_order: Optional[int] = None,
+        after_id: Optional[int] = None,
+        limit: int = Query(default=bootcamp_service.PAGE_SIZE, ge=1, le=bootcamp_service.MAX_PAGE_SIZE),
+    ) -> MsgspecJSONResponse:
+        _check_cursor(after_order, after_id)
+        return MsgspecJSONResponse(bootcamp_service.list_courses(bootcamp_id, after_order, after_id, limit))
+
+    @router.get("/courses/{course_id}/lessons")
+    def list_lessons(
+        course_id: int,
+        after_order: Optional[int] = None,
+        after_id: Optional[int] = None,
+        limit: int = Query(default=bootcamp_service.PAGE_SIZE, ge=1, le=bootcamp_service.MAX_PAGE_SIZE),
+    ) -> MsgspecJSONResponse:
+        _check_cursor(after_order, after_id)
+        return MsgspecJSONResponse(bootcamp_service.list_lessons(course_id, after_order, after_id, limit))
+
+    @router.get("/bootcamps/{bootcamp_id}/lessons/export")
+    def export_lessons(bootcamp_id: int) -> StreamingResponse:
+        return _json_stream(bootcamp_service.iter_bootcamp_lessons(bootcamp_id))
+
+    @router.get("/lessons/{lesson_id}")
+    def get_lesson(lesson_id: int) -> MsgspecJSONResponse:
+        lesson = bootcamp_service.get_lesson(lesson_id)
+        if lesson is None:
+            return MsgspecJSONResponse({"detail": "Lesson not found"}, status_code=404)
+        return MsgspecJSONResponse(lesson)
+
+    app.include_router(router)
@@ -0,0 +1,181 @@
+from typing import Any, Iterator, List, Optional, Sequence, Type, TypeVar, Union, cast
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import QueryableAttribute, load_only, selectinload
+from sqlmodel import Session, asc, col, desc, select, tuple_
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from app.database import explicit_loads, get_session
+from app.models import Bootcamp, BootcampTag, Course, Lesson, Quiz, Tag
+from app.schemas_fast import (
+    BootcampResponse,
+    CourseWithLessonsResponse,
+    Cursor,
+    LessonDetailResponse,
+    LessonSummaryResponse,
+    Page,
+    bootcamp_response,
+    course_response,
+    lesson_response,
+    lesson_summary_response,
+)
+
+
+def _rel(attribute: Any) -> QueryableAttribute[Any]:
+    # SQLModel annotates mapped attributes with their Python type (List[Tag], str); loader options want the attribute
+    return cast(QueryableAttribute[Any], attribute)
+
+
+_TAGS = selectinload(_rel(Bootcamp.tags))
+_LESSONS = selectinload(_rel(Bootcamp.courses)).selectinload(_rel(Course.lessons))
+_TREE = (
+    _TAGS,
+    _LESSONS.selectinload(_rel(Lesson.materials)),
+    _LESSONS.selectinload(_rel(Lesson.quizzes)).selectinload(_rel(Quiz.questions)),
+)
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# streamed exports fetch this many lessons per round trip, which bounds how many are held at once
+EXPORT_BATCH_SIZE = 100
+
+PagedQuery = TypeVar("PagedQuery", bound=Union[Select[Any], SelectOfScalar[Any]])
+
+
+def _page_size(limit: int) -> int:
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def _keyset_page(
+    query: PagedQuery,
+    model: Union[Type[Course], Type[Lesson]],
+    after_order: Optional[int],
+    after_id: Optional[int],
+    page_size: int,
+) -> PagedQuery:
+    """Restrict an order_index-ordered query to the page after the cursor; fetches one extra row
+
+    Every page is an index seek on (parent_id, order_index, id), however deep it is.
+    """
+    if (after_order is None) != (after_id is None):
+        # order_index alone is not unique: resuming from it would skip rows that tie with the last one
+        raise ValueError("after_order and after_id must be given together")
+    order_index, row_id = col(model.order_index), col(model.id)
+    if after_order is not None and after_id is not None:
+        query = query.where(tuple_(order_index, row_id) > tuple_(after_order, after_id))
+    return query.order_by(asc(order_index), asc(row_id)).limit(page_size + 1)
+
+
+def _next_cursor(rows: Sequence[Any], page_size: int) -> Optional[Cursor]:
+    # the extra row fetched by _keyset_page only signals that another page exists
+    if len(rows) <= page_size:
+        return None
+    last = rows[page_size - 1]
+    return Cursor(order_index=last.order_index, id=last.id)
+
+
+def get_or_create_tags(session: Session, names: List[str]) -> List[Tag]:
+    """Tags for the given names (deduplicated, in order), creating missing ones; doesn't commit
+
+    INSERT ... ON CONFLICT DO NOTHING makes concurrent callers creating the same tag safe; names are
+    inserted sorted so two callers always take the unique-index locks in the same order.
+    """
+    unique_names = list(dict.fromkeys(names))
+    if not unique_names:
+        return []
+    session.connection().execute(
+        pg_insert(Tag)
+        .values([{"name": name} for name in sorted(unique_names)])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    tags = {tag.name: tag for tag in session.exec(select(Tag).where(col(Tag.name).in_(unique_names))).all()}
+    return [tags[name] for name in unique_names]
+
+
+def list_bootcamps(tag: Optional[str] = None) -> List[BootcampResponse]:
+    with get_session() as session:
+        query = select(Bootcamp).options(*explicit_loads(_TAGS)).order_by(desc(Bootcamp.created_at), desc(Bootcamp.id))
+        if tag is not None:
+            # index seek on tags.name, then on bootcamp_tags.tag_id
+            query = (
+                query.join(BootcampTag, col(BootcampTag.bootcamp_id) == Bootcamp.id)
+                .join(Tag, col(Tag.id) == BootcampTag.tag_id)
+                .where(Tag.name == tag)
+            )
+        return [bootcamp_response(bootcamp) for bootcamp in session.exec(query).all()]
+
+
+def get_bootcamp(bootcamp_id: int) -> Optional[BootcampResponse]:
+    with get_session() as session:
+        bootcamp = session.get(Bootcamp, bootcamp_id, options=explicit_loads(_TAGS))
+        if bootcamp is None:
+            return None
+        return bootcamp_response(bootcamp)
+
+
+def get_bootcamp_tree(bootcamp_id: int) -> Optional[Bootcamp]:
+    """Bootcamp with courses, lessons, materials, quizzes and questions loaded in one query per level"""
+    with get_session() as session:
+        return session.get(Bootcamp, bootcamp_id, options=explicit_loads(*_TREE))
+
+
+def list_courses(
+    bootcamp_id: int, after_order: Optional[int] = None, after_id: Optional[int] = None, limit: int = PAGE_SIZE
+) -> Page[CourseWithLessonsResponse]:
+    page_size = _page_size(limit)
+    with get_session() as session:
+        query = select(Course).options(*explicit_loads()).where(Course.bootcamp_id == bootcamp_id)
+        courses = session.exec(_keyset_page(query, Course, after_order, after_id, page_size)).all()
+        items = [course_response(course) for course in courses[:page_size]]
+        return Page(items=items, next_cursor=_next_cursor(courses, page_size))
+
+
+def list_lessons(
+    course_id: int, after_order: Optional[int] = None, after_id: Optional[int] = None, limit: int = PAGE_SIZE
+) -> Page[LessonSummaryResponse]:
+    page_size = _page_size(limit)
+    with get_session() as session:
+        # only the columns LessonSummaryResponse needs; touching anything else (content) raises
+        summary_columns = load_only(
+            _rel(Lesson.title),
+            _rel(Lesson.summary),
+            _rel(Lesson.order_index),
+            _rel(Lesson.estimated_duration_minutes),
+            _rel(Lesson.materials_count),
+            _rel(Lesson.quizzes_count),
+            raiseload=True,
+        )
+        query = select(Lesson).options(*explicit_loads(summary_columns)).where(Lesson.course_id == course_id)
+        lessons = session.exec(_keyset_page(query, Lesson, after_order, after_id, page_size)).all()
+        items = [lesson_summary_response(lesson) for lesson in lessons[:page_size]]
+        return Page(items=items, next_cursor=_next_cursor(lessons, page_size))
+
+
+def iter_bootcamp_lessons(bootcamp_id: int) -> Iterator[LessonDetailResponse]:
+    """Every lesson of a bootcamp with its content, in course then lesson order
+
+    Rows come from a server-side cursor EXPORT_BATCH_SIZE at a time, so memory stays flat however
+    large the bootcamp is. The session stays open until the iterator is exhausted or closed.
+    """
+    with get_session() as session:
+        query = (
+            select(Lesson)
+            .join(Course, col(Course.id) == Lesson.course_id)
+            .options(*explicit_loads())
+            .where(Course.bootcamp_id == bootcamp_id)
+            .order_by(asc(Course.order_index), asc(Course.id), asc(Lesson.order_index), asc(Lesson.id))
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for lesson in session.exec(query):
+            yield lesson_response(lesson)
+
+
+def get_lesson(lesson_id: int) -> Optional[LessonDetailResponse]:
+    with get_session() as session:
+        lesson = session.get(Lesson, lesson_id, options=explicit_loads())
+        if lesson is None:
+            return None
+        return lesson_response(lesson)
@@ -0,0 +1,66 @@
+"""Choice enums, their wire values and storage codes.
+
+Standard library only, so generators, scripts and schema dumpers can use the choices without
+importing SQLModel/SQLAlchemy. app.models re-exports everything here.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Literal, Mapping, Type
+
+
+# Enums name the allowed values; fields are typed with the matching Literal aliases below and
+# members compare equal to (and are accepted as) the plain strings
+class DifficultyLevel(str, Enum):
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+
+
+class MaterialType(str, Enum):
+    TEXT = "text"
+    VIDEO = "video"
+    AUDIO = "audio"
+    PDF = "pdf"
+    IMAGE = "image"
+    INTERACTIVE = "interactive"
+
+
+class QuestionType(str, Enum):
+    MULTIPLE_CHOICE = "multiple_choice"
+    TRUE_FALSE = "true_false"
+    SHORT_ANSWER = "short_answer"
+    ESSAY = "essay"
+    CODING = "coding"
+
+
+class GenerationStatus(str, Enum):
+    PENDING = "pending"
+    GENERATING = "generating"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+DifficultyLevelValue = Literal["beginner", "intermediate", "advanced"]
+MaterialTypeValue = Literal["text", "video", "audio", "pdf", "image", "interactive"]
+QuestionTypeValue = Literal["multiple_choice", "true_false", "short_answer", "essay", "coding"]
+GenerationStatusValue = Literal["pending", "generating", "completed", "failed"]
+
+# SMALLINT codes the choices are stored as. Codes are persisted: never renumber one, only append.
+_STORAGE_CODES: Mapping[Type[Enum], Mapping[str, int]] = {
+    DifficultyLevel: {"beginner": 1, "intermediate": 2, "advanced": 3},
+    MaterialType: {"text": 1, "video": 2, "audio": 3, "pdf": 4, "image": 5, "interactive": 6},
+    QuestionType: {"multiple_choice": 1, "true_false": 2, "short_answer": 3, "essay": 4, "coding": 5},
+    GenerationStatus: {"pending": 1, "generating": 2, "completed": 3, "failed": 4},
+}
+
+
+def choice_codes(choices: Type[Enum]) -> Mapping[str, int]:
+    """Value -> storage code, e.g. {"beginner": 1, ...}; members work as keys too"""
+    return _STORAGE_CODES[choices]
+
+
+@lru_cache(maxsize=None)
+def choice_names(choices: Type[Enum]) -> Mapping[int, str]:
+    """Storage code -> value, e.g. {1: "beginner", ...}"""
+    return {code: name for name, code in _STORAGE_CODES[choices].items()}
@@ -0,0 +1,158 @@
+"""Bulk write paths for generated bootcamp content.
+
+Generation produces hundreds of lessons, materials and questions at once; these helpers
+insert them as plain rows instead of tracking one ORM instance per row.
+"""
+
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Type
+
+from sqlmodel import Session, SQLModel, text
+
+from app.enums import DifficultyLevel, QuestionType, choice_codes
+from app.models import LearningMaterial, LearningMaterialCreate, Question, validate_many
+
+BATCH_SIZE = 10_000
+
+_QUESTION_COLUMNS = (
+    "quiz_id",
+    "question_text",
+    "question_type",
+    "options",
+    "correct_answers",
+    "explanation",
+    "points",
+    "order_index",
+    "difficulty_level",
+    "tags",
+)
+
+
+def _code_case(column: str, choices: Type[Enum], default: str) -> str:
+    # SQL mapping a wire name to its SMALLINT code; unknown names give NULL and fail NOT NULL
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in choice_codes(choices).items())
+    return f"CASE coalesce({column}, '{default}') {whens} END"
+
+
+# Postgres expands the generated JSON array itself; missing keys fall back to the model defaults
+_INSERT_QUESTIONS_FROM_JSON = text(f"""
+    INSERT INTO {Question.__tablename__} ({", ".join(_QUESTION_COLUMNS)})
+    SELECT
+        q.quiz_id,
+        q.question_text,
+        {_code_case("q.question_type", QuestionType, "multiple_choice")},
+        coalesce(q.options, '[]'),
+        coalesce(q.correct_answers, '[]'),
+        coalesce(q.explanation, ''),
+        coalesce(q.points, 1),
+        q.order_index,
+        {_code_case("q.difficulty_level", DifficultyLevel, "beginner")},
+        coalesce(q.tags, '[]')
+    FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS q(
+        quiz_id int,
+        question_text text,
+        question_type text,
+        options jsonb,
+        correct_answers jsonb,
+        explanation text,
+        points int,
+        order_index int,
+        difficulty_level text,
+        tags jsonb
+    )
+""")
+
+
+def _insert_defaults(model: Type[SQLModel]) -> Dict[str, Any]:
+    # evaluated once per call; timestamps default to None, which the ORM leaves out of the INSERT
+    # for columns with a server_default, so Postgres still fills them in
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if name != "id" and not field.is_required()
+    }
+
+
+def bulk_insert(
+    session: Session, model: Type[SQLModel], rows: Sequence[Mapping[str, Any]], batch_size: int = BATCH_SIZE
+) -> int:
+    """Insert rows for a table model via bulk_insert_mappings; returns the number of rows inserted.
+
+    Rows must already be validated (e.g. dumped from the *Create schemas); fields they omit
+    get the model defaults and created_at is filled in by Postgres. The caller owns the transaction.
+    """
+    defaults = _insert_defaults(model)
+    for start in range(0, len(rows), batch_size):
+        batch: List[Dict[str, Any]] = [{**defaults, **row} for row in rows[start : start + batch_size]]
+        session.bulk_insert_mappings(model, batch)  # type: ignore[arg-type]
+    return len(rows)
+
+
+def insert_materials(session: Session, rows: Sequence[Mapping[str, Any]]) -> int:
+    """Validate learning material rows through LearningMaterialCreate and bulk_insert them.
+
+    Validation promotes known material_metadata keys to their columns, so those values are
+    checked before they reach the INTEGER/VARCHAR columns.
+    """
+    materials = validate_many(LearningMaterialCreate, rows)
+    return bulk_insert(session, LearningMaterial, [material.model_dump() for material in materials])
+
+
+def questions_to_csv(rows: Iterable[Mapping[str, Any]]) -> Tuple[io.StringIO, int]:
+    """COPY CSV payload for question rows (choices as storage codes), rewound; plus the row count"""
+    defaults = _insert_defaults(Question)
+    question_types, difficulty_levels = choice_codes(QuestionType), choice_codes(DifficultyLevel)
+    buffer = io.StringIO()
+    # quote everything: in COPY CSV an unquoted empty field means NULL, not ""
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    count = 0
+    for row in rows:
+        values = {**defaults, **row}
+        writer.writerow(
+            (
+                values["quiz_id"],
+                values["question_text"],
+                question_types[values["question_type"]],
+                json.dumps(values["options"]),
+                json.dumps(values["correct_answers"]),
+                values["explanation"],
+                values["points"],
+                values["order_index"],
+                difficulty_levels[values["difficulty_level"]],
+                json.dumps(values["tags"]),
+            )
+        )
+        count += 1
+    buffer.seek(0)
+    return buffer, count
+
+
+def copy_questions(session: Session, rows: Iterable[Mapping[str, Any]]) -> int:
+    """Load question rows with a single COPY FROM STDIN; returns the number of rows copied.
+
+    Meant for generated quiz sets; single-row edits keep using the ORM. Rows follow the
+    QuestionCreate shape and must already be validated. The caller owns the transaction.
+    """
+    buffer, count = questions_to_csv(rows)
+    # COPY runs on the psycopg2 connection underneath the session, inside its transaction
+    dbapi_connection = session.connection().connection.driver_connection
+    if dbapi_connection is None:
+        raise RuntimeError("copy_questions needs a session bound to a live DBAPI connection")
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {Question.__tablename__} ({', '.join(_QUESTION_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer
+        )
+    return count
+
+
+def insert_questions_from_json(session: Session, raw_json: str) -> int:
+    """Insert a generated JSON array of questions in one statement; returns the number of rows.
+
+    The array is forwarded to Postgres untouched, so no QuestionCreate instances are built and
+    no Pydantic validation runs: only use it for generator output. The caller owns the transaction.
+    """
+    result = session.connection().execute(_INSERT_QUESTIONS_FROM_JSON, {"payload": raw_json})
+    return result.rowcount
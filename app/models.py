@@ -1,112 +1,187 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import SQLModel, Field, Relationship, Column
+from sqlalchemy import DDL, CheckConstraint, DateTime, Index, SmallInteger, Text, TypeDecorator, event, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any, Mapping, Sequence, Type, TypeVar
 from enum import Enum
+from pydantic import StringConstraints, TypeAdapter, model_validator
 
+# choice enums are defined without ORM imports in app.enums and re-exported here
+from app.enums import (
+    DifficultyLevel,
+    DifficultyLevelValue,
+    GenerationStatus,
+    GenerationStatusValue,
+    MaterialType,
+    MaterialTypeValue,
+    QuestionType,
+    QuestionTypeValue,
+    choice_codes,
+    choice_names,
+)
 
-# Enums for type safety
-class DifficultyLevel(str, Enum):
-    BEGINNER = "beginner"
-    INTERMEDIATE = "intermediate"
-    ADVANCED = "advanced"
 
+class ChoiceCode(TypeDecorator):
+    """SMALLINT column holding the storage code of a choice; reads and writes its string value"""
 
-class MaterialType(str, Enum):
-    TEXT = "text"
-    VIDEO = "video"
-    AUDIO = "audio"
-    PDF = "pdf"
-    IMAGE = "image"
-    INTERACTIVE = "interactive"
+    impl = SmallInteger
+    cache_ok = True
 
+    def __init__(self, choices: Type[Enum]):
+        super().__init__()
+        self.choices = choices
 
-class QuestionType(str, Enum):
-    MULTIPLE_CHOICE = "multiple_choice"
-    TRUE_FALSE = "true_false"
-    SHORT_ANSWER = "short_answer"
-    ESSAY = "essay"
-    CODING = "coding"
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        if value is None:
+            return None
+        return choice_codes(self.choices)[value]
 
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return choice_names(self.choices)[value]
 
-class GenerationStatus(str, Enum):
-    PENDING = "pending"
-    GENERATING = "generating"
-    COMPLETED = "completed"
-    FAILED = "failed"
+
+def _choice_column(name: str, choices: Type[Enum]) -> Column:
+    # 2 bytes per row instead of the name; the CHECK keeps out codes no member owns
+    allowed = ", ".join(str(code) for code in choice_codes(choices).values())
+    return Column(ChoiceCode(choices), CheckConstraint(f"{name} IN ({allowed})"), nullable=False)
+
+
+def _utc_timestamp_column() -> Column:
+    # filled in by Postgres when the INSERT omits it, so bulk inserts make no per-row Python calls;
+    # stored as naive UTC like the existing timestamps. now() is the transaction start time, so every
+    # row written in one transaction shares it: order by id as well when creation order matters
+    return Column(DateTime, nullable=False, server_default=text("(now() AT TIME ZONE 'utc')"))
 
 
 # Persistent models (stored in database)
+# Free-text columns are TEXT; their length limits are enforced by the *Create schemas
+class Tag(SQLModel, table=True):
+    __tablename__ = "tags"  # type: ignore[assignment]
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True, index=True, max_length=100, sa_type=Text)
+
+
+class BootcampTag(SQLModel, table=True):
+    __tablename__ = "bootcamp_tags"  # type: ignore[assignment]
+
+    bootcamp_id: Optional[int] = Field(default=None, foreign_key="bootcamps.id", primary_key=True)
+    # indexed on its own for "bootcamps tagged X" lookups; the primary key leads with bootcamp_id
+    tag_id: Optional[int] = Field(default=None, foreign_key="tags.id", primary_key=True, index=True)
+
+
 class Bootcamp(SQLModel, table=True):
     __tablename__ = "bootcamps"  # type: ignore[assignment]
+    __table_args__ = (
+        # jsonb_path_ops GIN index serves containment filters such as prerequisites @> '["python"]'
+        Index(
+            "ix_bootcamps_prerequisites_gin",
+            "prerequisites",
+            postgresql_using="gin",
+            postgresql_ops={"prerequisites": "jsonb_path_ops"},
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    title: str = Field(max_length=200)
-    topic: str = Field(max_length=100)
-    description: str = Field(default="", max_length=2000)
-    difficulty_level: DifficultyLevel = Field(default=DifficultyLevel.BEGINNER)
+    title: str = Field(max_length=200, sa_type=Text)
+    topic: str = Field(max_length=100, sa_type=Text)
+    description: str = Field(default="", max_length=2000, sa_type=Text)
+    difficulty_level: DifficultyLevelValue = Field(
+        default="beginner", sa_column=_choice_column("difficulty_level", DifficultyLevel)
+    )
     estimated_duration_hours: int = Field(default=40, ge=1, le=1000)
-    learning_objectives: List[str] = Field(default=[], sa_column=Column(JSON))
-    prerequisites: List[str] = Field(default=[], sa_column=Column(JSON))
-    tags: List[str] = Field(default=[], sa_column=Column(JSON))
-    generation_status: GenerationStatus = Field(default=GenerationStatus.PENDING)
-    generation_prompt: str = Field(default="", max_length=5000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    learning_objectives: List[str] = Field(default=[], sa_column=Column(JSONB))
+    prerequisites: List[str] = Field(default=[], sa_column=Column(JSONB))
+    generation_status: GenerationStatusValue = Field(
+        default="pending", sa_column=_choice_column("generation_status", GenerationStatus)
+    )
+    generation_prompt: str = Field(default="", max_length=5000, sa_type=Text)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Relationships
-    courses: List["Course"] = Relationship(back_populates="bootcamp", cascade_delete=True)
+    courses: List["Course"] = Relationship(
+        back_populates="bootcamp", cascade_delete=True, sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    # alphabetical: the link table keeps no position, and responses need a stable order
+    tags: List[Tag] = Relationship(
+        link_model=BootcampTag, sa_relationship_kwargs={"lazy": "selectin", "order_by": "Tag.name"}
+    )
 
 
 class Course(SQLModel, table=True):
     __tablename__ = "courses"  # type: ignore[assignment]
+    # id breaks order_index ties, so keyset pages (order_index, id) are a single index range scan
+    __table_args__ = (Index("ix_courses_bootcamp_order", "bootcamp_id", "order_index", "id"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     bootcamp_id: int = Field(foreign_key="bootcamps.id")
-    title: str = Field(max_length=200)
-    description: str = Field(default="", max_length=2000)
+    title: str = Field(max_length=200, sa_type=Text)
+    description: str = Field(default="", max_length=2000, sa_type=Text)
     order_index: int = Field(ge=0)
     estimated_duration_hours: int = Field(default=8, ge=1, le=100)
-    learning_outcomes: List[str] = Field(default=[], sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    learning_outcomes: List[str] = Field(default=[], sa_column=Column(JSONB))
+    lessons_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})  # maintained by trigger
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
-    # Relationships
+    # Relationships: collections are selectin-loaded; parents load only on access (or via joinedload
+    # in the query that needs them), so loading one row never chains joins up the tree
     bootcamp: Bootcamp = Relationship(back_populates="courses")
-    lessons: List["Lesson"] = Relationship(back_populates="course", cascade_delete=True)
+    lessons: List["Lesson"] = Relationship(
+        back_populates="course", cascade_delete=True, sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class Lesson(SQLModel, table=True):
     __tablename__ = "lessons"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_lessons_course_order", "course_id", "order_index", "id"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     course_id: int = Field(foreign_key="courses.id")
-    title: str = Field(max_length=200)
-    content: str = Field(default="")
-    summary: str = Field(default="", max_length=1000)
+    title: str = Field(max_length=200, sa_type=Text)
+    content: str = Field(default="", sa_type=Text)
+    summary: str = Field(default="", max_length=1000, sa_type=Text)
     order_index: int = Field(ge=0)
     estimated_duration_minutes: int = Field(default=60, ge=1, le=480)
-    key_concepts: List[str] = Field(default=[], sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    key_concepts: List[str] = Field(default=[], sa_column=Column(JSONB))
+    # maintained by triggers
+    materials_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    quizzes_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Relationships
     course: Course = Relationship(back_populates="lessons")
-    materials: List["LearningMaterial"] = Relationship(back_populates="lesson", cascade_delete=True)
-    quizzes: List["Quiz"] = Relationship(back_populates="lesson", cascade_delete=True)
+    materials: List["LearningMaterial"] = Relationship(
+        back_populates="lesson", cascade_delete=True, sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    quizzes: List["Quiz"] = Relationship(
+        back_populates="lesson", cascade_delete=True, sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class LearningMaterial(SQLModel, table=True):
     __tablename__ = "learning_materials"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_learning_materials_lesson_order", "lesson_id", "order_index"),
+        Index("ix_learning_materials_language", "language"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     lesson_id: int = Field(foreign_key="lessons.id")
-    title: str = Field(max_length=200)
-    description: str = Field(default="", max_length=1000)
-    material_type: MaterialType = Field(default=MaterialType.TEXT)
-    content: str = Field(default="")
+    title: str = Field(max_length=200, sa_type=Text)
+    description: str = Field(default="", max_length=1000, sa_type=Text)
+    material_type: MaterialTypeValue = Field(default="text", sa_column=_choice_column("material_type", MaterialType))
+    content: str = Field(default="", sa_type=Text)
     url: Optional[str] = Field(default=None, max_length=500)
     file_path: Optional[str] = Field(default=None, max_length=500)
     order_index: int = Field(ge=0)
-    material_metadata: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # common metadata keys get real columns; material_metadata only holds the rest
+    duration_seconds: Optional[int] = Field(default=None, ge=0)
+    language: Optional[str] = Field(default=None, max_length=50)
+    material_metadata: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Relationships
     lesson: Lesson = Relationship(back_populates="materials")
@@ -114,66 +189,132 @@ class LearningMaterial(SQLModel, table=True):
 
 class Quiz(SQLModel, table=True):
     __tablename__ = "quizzes"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_quizzes_lesson_order", "lesson_id", "order_index"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     lesson_id: Optional[int] = Field(default=None, foreign_key="lessons.id")
     bootcamp_id: Optional[int] = Field(default=None, foreign_key="bootcamps.id")
-    title: str = Field(max_length=200)
-    description: str = Field(default="", max_length=1000)
+    title: str = Field(max_length=200, sa_type=Text)
+    description: str = Field(default="", max_length=1000, sa_type=Text)
     is_exam: bool = Field(default=False)
     time_limit_minutes: Optional[int] = Field(default=None, ge=1, le=300)
     passing_score_percentage: int = Field(default=70, ge=0, le=100)
     max_attempts: int = Field(default=3, ge=1, le=10)
     order_index: int = Field(ge=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Relationships
     lesson: Optional[Lesson] = Relationship(back_populates="quizzes")
-    questions: List["Question"] = Relationship(back_populates="quiz", cascade_delete=True)
+    questions: List["Question"] = Relationship(
+        back_populates="quiz", cascade_delete=True, sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class Question(SQLModel, table=True):
     __tablename__ = "questions"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_questions_quiz_order", "quiz_id", "order_index"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     quiz_id: int = Field(foreign_key="quizzes.id")
-    question_text: str = Field(max_length=2000)
-    question_type: QuestionType = Field(default=QuestionType.MULTIPLE_CHOICE)
-    options: List[str] = Field(default=[], sa_column=Column(JSON))
-    correct_answers: List[str] = Field(default=[], sa_column=Column(JSON))
-    explanation: str = Field(default="", max_length=1000)
+    question_text: str = Field(max_length=2000, sa_type=Text)
+    question_type: QuestionTypeValue = Field(
+        default="multiple_choice", sa_column=_choice_column("question_type", QuestionType)
+    )
+    options: List[str] = Field(default=[], sa_column=Column(JSONB))
+    correct_answers: List[str] = Field(default=[], sa_column=Column(JSONB))
+    explanation: str = Field(default="", max_length=1000, sa_type=Text)
     points: int = Field(default=1, ge=1, le=10)
     order_index: int = Field(ge=0)
-    difficulty_level: DifficultyLevel = Field(default=DifficultyLevel.BEGINNER)
-    tags: List[str] = Field(default=[], sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    difficulty_level: DifficultyLevelValue = Field(
+        default="beginner", sa_column=_choice_column("difficulty_level", DifficultyLevel)
+    )
+    tags: List[str] = Field(default=[], sa_column=Column(JSONB))
+    created_at: Optional[datetime] = Field(default=None, sa_column=_utc_timestamp_column())
 
     # Relationships
     quiz: Quiz = Relationship(back_populates="questions")
 
 
-# Non-persistent schemas (for validation, forms, API requests/responses)
+# Child counters on parent rows are kept in sync by Postgres, so bulk inserts and COPY loads
+# that bypass the ORM still update them. The triggers are statement-level: each statement applies
+# one grouped UPDATE per parent instead of one UPDATE per child row, so a 10k-row load into one
+# course touches its row once. Postgres allows transition tables only on single-event triggers
+# without column lists, hence one trigger per event.
+def _child_count_ddl(child_table: str, parent_table: str, counter: str, fk: str) -> List[DDL]:
+    function = f"count_{child_table}_in_{parent_table}"
+
+    def bump(deltas: str) -> str:
+        return (
+            f"UPDATE {parent_table} AS parent SET {counter} = parent.{counter} + d.delta "
+            f"FROM (SELECT {fk}, sum(delta) AS delta FROM ({deltas}) AS rows "
+            f"WHERE {fk} IS NOT NULL GROUP BY {fk} HAVING sum(delta) <> 0) AS d WHERE parent.id = d.{fk};"
+        )
+
+    added, removed = f"SELECT {fk}, 1 AS delta FROM new_rows", f"SELECT {fk}, -1 AS delta FROM old_rows"
+    statements = [
+        DDL(f"""
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {bump(added)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {bump(removed)}
+    ELSE
+        {bump(f"{added} UNION ALL {removed}")}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+    ]
+    for event_name, referencing in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ):
+        statements.append(
+            DDL(
+                f"CREATE TRIGGER trg_{child_table}_{counter}_{event_name.lower()} AFTER {event_name} ON {child_table} "
+                f"REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+            )
+        )
+    return statements
+
+
+for _child_table, _parent_table, _counter, _fk in (
+    ("lessons", "courses", "lessons_count", "course_id"),
+    ("learning_materials", "lessons", "materials_count", "lesson_id"),
+    ("quizzes", "lessons", "quizzes_count", "lesson_id"),
+):
+    for _ddl in _child_count_ddl(_child_table, _parent_table, _counter, _fk):
+        event.listen(SQLModel.metadata.tables[_child_table], "after_create", _ddl)
+
+
+# Non-persistent schemas (for validation, forms, API requests); responses are in app.schemas_fast
+TagName = Annotated[str, StringConstraints(max_length=100)]
+
+
 class BootcampCreate(SQLModel, table=False):
     title: str = Field(max_length=200)
     topic: str = Field(max_length=100)
     description: str = Field(default="", max_length=2000)
-    difficulty_level: DifficultyLevel = Field(default=DifficultyLevel.BEGINNER)
+    difficulty_level: DifficultyLevelValue = Field(default="beginner")
     estimated_duration_hours: int = Field(default=40, ge=1, le=1000)
     learning_objectives: List[str] = Field(default=[])
     prerequisites: List[str] = Field(default=[])
-    tags: List[str] = Field(default=[])
+    tags: List[TagName] = Field(default=[])
     generation_prompt: str = Field(default="", max_length=5000)
 
 
 class BootcampUpdate(SQLModel, table=False):
     title: Optional[str] = Field(default=None, max_length=200)
     description: Optional[str] = Field(default=None, max_length=2000)
-    difficulty_level: Optional[DifficultyLevel] = Field(default=None)
+    difficulty_level: Optional[DifficultyLevelValue] = Field(default=None)
     estimated_duration_hours: Optional[int] = Field(default=None, ge=1, le=1000)
     learning_objectives: Optional[List[str]] = Field(default=None)
     prerequisites: Optional[List[str]] = Field(default=None)
-    tags: Optional[List[str]] = Field(default=None)
-    generation_status: Optional[GenerationStatus] = Field(default=None)
+    tags: Optional[List[TagName]] = Field(default=None)
+    generation_status: Optional[GenerationStatusValue] = Field(default=None)
 
 
 class CourseCreate(SQLModel, table=False):
@@ -195,17 +336,40 @@ class LessonCreate(SQLModel, table=False):
     key_concepts: List[str] = Field(default=[])
 
 
+# material_metadata keys that have their own LearningMaterial columns
+MATERIAL_COLUMN_KEYS = ("duration_seconds", "language")
+
+
 class LearningMaterialCreate(SQLModel, table=False):
     lesson_id: int
     title: str = Field(max_length=200)
     description: str = Field(default="", max_length=1000)
-    material_type: MaterialType = Field(default=MaterialType.TEXT)
+    material_type: MaterialTypeValue = Field(default="text")
     content: str = Field(default="")
     url: Optional[str] = Field(default=None, max_length=500)
     file_path: Optional[str] = Field(default=None, max_length=500)
     order_index: int = Field(ge=0)
+    duration_seconds: Optional[int] = Field(default=None, ge=0)
+    language: Optional[str] = Field(default=None, max_length=50)
     material_metadata: Dict[str, Any] = Field(default={})
 
+    @model_validator(mode="before")
+    @classmethod
+    def promote_metadata(cls, data: Any) -> Any:
+        """Move known material_metadata keys into their columns, where they are validated like any field.
+
+        A column given explicitly wins; the metadata value it conflicts with stays in the overflow.
+        """
+        if not isinstance(data, Mapping) or not isinstance(data.get("material_metadata"), Mapping):
+            return data
+        values = dict(data)
+        overflow = dict(values["material_metadata"])
+        for key in MATERIAL_COLUMN_KEYS:
+            if key in overflow and values.get(key) is None:
+                values[key] = overflow.pop(key)
+        values["material_metadata"] = overflow
+        return values
+
 
 class QuizCreate(SQLModel, table=False):
     lesson_id: Optional[int] = Field(default=None)
@@ -222,49 +386,36 @@ class QuizCreate(SQLModel, table=False):
 class QuestionCreate(SQLModel, table=False):
     quiz_id: int
     question_text: str = Field(max_length=2000)
-    question_type: QuestionType = Field(default=QuestionType.MULTIPLE_CHOICE)
+    question_type: QuestionTypeValue = Field(default="multiple_choice")
     options: List[str] = Field(default=[])
     correct_answers: List[str] = Field(default=[])
     explanation: str = Field(default="", max_length=1000)
     points: int = Field(default=1, ge=1, le=10)
     order_index: int = Field(ge=0)
-    difficulty_level: DifficultyLevel = Field(default=DifficultyLevel.BEGINNER)
+    difficulty_level: DifficultyLevelValue = Field(default="beginner")
     tags: List[str] = Field(default=[])
 
 
-# Response schemas for API
-class BootcampResponse(SQLModel, table=False):
-    id: int
-    title: str
-    topic: str
-    description: str
-    difficulty_level: DifficultyLevel
-    estimated_duration_hours: int
-    learning_objectives: List[str]
-    prerequisites: List[str]
-    tags: List[str]
-    generation_status: GenerationStatus
-    created_at: str
-    updated_at: str
-
-
-class CourseWithLessonsResponse(SQLModel, table=False):
-    id: int
-    title: str
-    description: str
-    order_index: int
-    estimated_duration_hours: int
-    learning_outcomes: List[str]
-    lessons_count: int
-
-
-class LessonDetailResponse(SQLModel, table=False):
-    id: int
-    title: str
-    content: str
-    summary: str
-    order_index: int
-    estimated_duration_minutes: int
-    key_concepts: List[str]
-    materials_count: int
-    quizzes_count: int
+# Cached validators for write paths: building a TypeAdapter costs far more than validating with one.
+# Keys are schema classes and List[...] of them, a small fixed set, so the cache needs no bound.
+_ADAPTERS: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def get_type_adapter(tp: Any) -> TypeAdapter[Any]:
+    adapter = _ADAPTERS.get(tp)
+    if adapter is None:
+        adapter = _ADAPTERS[tp] = TypeAdapter(tp)
+    return adapter
+
+
+SchemaT = TypeVar("SchemaT", bound=SQLModel)
+
+
+def validate(cls: Type[SchemaT], payload: Mapping[str, Any]) -> SchemaT:
+    """Validate a request payload against a Create/Update schema using its cached adapter"""
+    return get_type_adapter(cls).validate_python(payload)
+
+
+def validate_many(cls: Type[SchemaT], payloads: Sequence[Mapping[str, Any]]) -> List[SchemaT]:
+    """Validate a batch of payloads (e.g. generated questions) in a single pydantic-core call"""
+    return get_type_adapter(List[cls]).validate_python(payloads)
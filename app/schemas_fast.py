@@ -0,0 +1,143 @@
+"""API response schemas, as msgspec Structs.
+
+Responses are built from rows that were validated on insert, so they skip Pydantic
+validation entirely and are encoded to JSON by msgspec in a single C pass.
+SQLModel classes in app.models are for persistence and request validation only.
+"""
+
+from datetime import datetime
+from typing import Generic, List, Optional, TypeVar
+
+import msgspec
+
+from app.enums import DifficultyLevelValue, GenerationStatusValue
+from app.models import Bootcamp, Course, Lesson
+
+
+# gc=False: responses hold only scalars and lists of strings, so they can never form cycles
+class BootcampResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    title: str
+    topic: str
+    description: str
+    difficulty_level: DifficultyLevelValue
+    estimated_duration_hours: int
+    learning_objectives: List[str]
+    prerequisites: List[str]
+    tags: List[str]
+    generation_status: GenerationStatusValue
+    created_at: datetime  # encoded by msgspec as ISO 8601
+    updated_at: datetime
+
+
+class CourseWithLessonsResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    title: str
+    description: str
+    order_index: int
+    estimated_duration_hours: int
+    learning_outcomes: List[str]
+    lessons_count: int
+
+
+class LessonDetailResponse(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    title: str
+    content: str
+    summary: str
+    order_index: int
+    estimated_duration_minutes: int
+    key_concepts: List[str]
+    materials_count: int
+    quizzes_count: int
+
+
+class LessonSummaryResponse(msgspec.Struct, frozen=True, gc=False):
+    """Listing row for a lesson: everything but the (multi-KB) content and key_concepts"""
+
+    id: int
+    title: str
+    summary: str
+    order_index: int
+    estimated_duration_minutes: int
+    materials_count: int
+    quizzes_count: int
+
+
+T = TypeVar("T")
+
+
+class Cursor(msgspec.Struct, frozen=True, gc=False):
+    """Position of the last row on a page; passed back as ?after_order=&after_id="""
+
+    order_index: int
+    id: int
+
+
+class Page(msgspec.Struct, Generic[T], frozen=True, gc=False):
+    items: List[T]
+    next_cursor: Optional[Cursor]  # None on the last page
+
+
+def bootcamp_response(bootcamp: Bootcamp) -> BootcampResponse:
+    # timestamps are filled in by Postgres, so they are None until the row has been written and read back
+    if bootcamp.id is None or bootcamp.created_at is None or bootcamp.updated_at is None:
+        raise ValueError("Bootcamp must be persisted before building a response")
+    return BootcampResponse(
+        id=bootcamp.id,
+        title=bootcamp.title,
+        topic=bootcamp.topic,
+        description=bootcamp.description,
+        difficulty_level=bootcamp.difficulty_level,
+        estimated_duration_hours=bootcamp.estimated_duration_hours,
+        learning_objectives=bootcamp.learning_objectives,
+        prerequisites=bootcamp.prerequisites,
+        tags=[tag.name for tag in bootcamp.tags],
+        generation_status=bootcamp.generation_status,
+        created_at=bootcamp.created_at,
+        updated_at=bootcamp.updated_at,
+    )
+
+
+def course_response(course: Course) -> CourseWithLessonsResponse:
+    if course.id is None:
+        raise ValueError("Course must be persisted before building a response")
+    return CourseWithLessonsResponse(
+        id=course.id,
+        title=course.title,
+        description=course.description,
+        order_index=course.order_index,
+        estimated_duration_hours=course.estimated_duration_hours,
+        learning_outcomes=course.learning_outcomes,
+        lessons_count=course.lessons_count,
+    )
+
+
+def lesson_response(lesson: Lesson) -> LessonDetailResponse:
+    if lesson.id is None:
+        raise ValueError("Lesson must be persisted before building a response")
+    return LessonDetailResponse(
+        id=lesson.id,
+        title=lesson.title,
+        content=lesson.content,
+        summary=lesson.summary,
+        order_index=lesson.order_index,
+        estimated_duration_minutes=lesson.estimated_duration_minutes,
+        key_concepts=lesson.key_concepts,
+        materials_count=lesson.materials_count,
+        quizzes_count=lesson.quizzes_count,
+    )
+
+
+def lesson_summary_response(lesson: Lesson) -> LessonSummaryResponse:
+    if lesson.id is None:
+        raise ValueError("Lesson must be persisted before building a response")
+    return LessonSummaryResponse(
+        id=lesson.id,
+        title=lesson.title,
+        summary=lesson.summary,
+        order_index=lesson.order_index,
+        estimated_duration_minutes=lesson.estimated_duration_minutes,
+        materials_count=lesson.materials_count,
+        quizzes_count=lesson.quizzes_count,
+    )
@@ -1,7 +1,13 @@
+import os
 from typing import Generator
 import pytest
-from app.startup import startup
-from nicegui.testing import User
+
+# Surface relationship loads that queries did not request explicitly
+os.environ.setdefault("APP_STRICT_LOADING", "1")
+
+from app.database import reset_db  # noqa: E402
+from app.startup import startup  # noqa: E402
+from nicegui.testing import User  # noqa: E402
 
 pytest_plugins = ["nicegui.testing.plugin"]
 
@@ -10,3 +16,10 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
@@ -0,0 +1,93 @@
+from typing import Tuple
+
+import pytest
+from nicegui.testing import User
+
+from app.bootcamp_service import MAX_PAGE_SIZE
+from app.database import get_session
+from app.models import Bootcamp, Course, Lesson
+
+
+def _seed_course(lessons: int) -> Tuple[int, int]:
+    with get_session() as session:
+        bootcamp = Bootcamp(title="Python Bootcamp", topic="python")
+        session.add(bootcamp)
+        session.commit()
+        session.refresh(bootcamp)
+        assert bootcamp.id is not None
+        course = Course(bootcamp_id=bootcamp.id, title="Basics", order_index=0)
+        session.add(course)
+        session.commit()
+        session.refresh(course)
+        assert course.id is not None
+        for index in range(lessons):
+            session.add(Lesson(course_id=course.id, title=f"Lesson {index}", order_index=index))
+        session.commit()
+        return bootcamp.id, course.id
+
+
+@pytest.mark.sqlmodel
+@pytest.mark.parametrize(
+    "path, detail",
+    [("/api/bootcamps/999", "Bootcamp not found"), ("/api/lessons/999", "Lesson not found")],
+)
+async def test_missing_rows_are_json_404s(user: User, clean_db, path: str, detail: str):
+    # raising HTTPException(404) would be rendered as HTML by NiceGUI's app-wide handler
+    response = await user.http_client.get(path)
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detail": detail}
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["after_order=1", "after_id=1", "limit=0", f"limit={MAX_PAGE_SIZE + 1}"],
+)
+async def test_listing_parameters_are_validated(user: User, query: str):
+    # both checks run before the listing touches the database
+    response = await user.http_client.get(f"/api/courses/1/lessons?{query}")
+
+    assert response.status_code == 422
+
+
+@pytest.mark.sqlmodel
+async def test_lesson_pages_follow_the_cursor(user: User, clean_db):
+    _, course_id = _seed_course(lessons=3)
+
+    response = await user.http_client.get(f"/api/courses/{course_id}/lessons?limit=2")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    page = response.json()
+    assert set(page) == {"items", "next_cursor"}
+    assert [lesson["title"] for lesson in page["items"]] == ["Lesson 0", "Lesson 1"]
+    assert page["next_cursor"] == {"order_index": 1, "id": page["items"][1]["id"]}
+
+    cursor = page["next_cursor"]
+    response = await user.http_client.get(
+        f"/api/courses/{course_id}/lessons",
+        params={"after_order": cursor["order_index"], "after_id": cursor["id"], "limit": 2},
+    )
+    page = response.json()
+    assert [lesson["title"] for lesson in page["items"]] == ["Lesson 2"]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.sqlmodel
+async def test_lesson_export_streams_a_json_array(user: User, clean_db):
+    bootcamp_id, _ = _seed_course(lessons=3)
+
+    response = await user.http_client.get(f"/api/bootcamps/{bootcamp_id}/lessons/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert [lesson["title"] for lesson in response.json()] == ["Lesson 0", "Lesson 1", "Lesson 2"]
+    assert "content" in response.json()[0]
+
+
+@pytest.mark.sqlmodel
+async def test_empty_lesson_export_is_an_empty_array(user: User, clean_db):
+    response = await user.http_client.get("/api/bootcamps/999/lessons/export")
+
+    assert response.status_code == 200
+    assert response.content == b"[]"
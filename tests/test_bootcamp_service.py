@@ -0,0 +1,231 @@
+import json
+
+import msgspec
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm.attributes import instance_state
+from sqlmodel import select
+
+from app import bootcamp_service
+from app.database import STRICT_LOADING, explicit_loads, get_session
+from app.models import Bootcamp, Course, LearningMaterial, Lesson, Quiz, Tag
+
+
+def _seed_bootcamp() -> int:
+    with get_session() as session:
+        bootcamp = Bootcamp(
+            title="Python Bootcamp",
+            topic="python",
+            difficulty_level="intermediate",
+            tags=bootcamp_service.get_or_create_tags(session, ["python", "backend"]),
+        )
+        session.add(bootcamp)
+        session.commit()
+        session.refresh(bootcamp)
+        assert bootcamp.id is not None
+
+        for course_index in range(2):
+            course = Course(bootcamp_id=bootcamp.id, title=f"Course {course_index}", order_index=course_index)
+            session.add(course)
+            session.commit()
+            session.refresh(course)
+            assert course.id is not None
+            for lesson_index in range(course_index + 1):
+                session.add(Lesson(course_id=course.id, title=f"Lesson {lesson_index}", order_index=lesson_index))
+        session.commit()
+        return bootcamp.id
+
+
+@pytest.mark.sqlmodel
+def test_get_bootcamp(clean_db):
+    bootcamp_id = _seed_bootcamp()
+
+    bootcamp = bootcamp_service.get_bootcamp(bootcamp_id)
+
+    assert bootcamp is not None
+    assert bootcamp.title == "Python Bootcamp"
+    assert bootcamp.tags == ["backend", "python"]
+    assert bootcamp_service.get_bootcamp(bootcamp_id + 1) is None
+
+
+@pytest.mark.sqlmodel
+def test_list_bootcamps_filters_by_tag(clean_db):
+    _seed_bootcamp()
+    with get_session() as session:
+        session.add(
+            Bootcamp(
+                title="Design", topic="ux", tags=bootcamp_service.get_or_create_tags(session, ["design", "python"])
+            )
+        )
+        session.commit()
+
+    assert len(bootcamp_service.list_bootcamps()) == 2
+    assert [bootcamp.title for bootcamp in bootcamp_service.list_bootcamps("backend")] == ["Python Bootcamp"]
+    assert [bootcamp.tags for bootcamp in bootcamp_service.list_bootcamps("python")] == [
+        ["design", "python"],
+        ["backend", "python"],
+    ]
+    assert bootcamp_service.list_bootcamps("rust") == []
+
+
+@pytest.mark.sqlmodel
+def test_list_bootcamps_breaks_timestamp_ties_by_id(clean_db):
+    with get_session() as session:
+        # one transaction: all rows get the same created_at
+        session.add_all([Bootcamp(title=title, topic="python") for title in ["First", "Second", "Third"]])
+        session.commit()
+
+    assert [bootcamp.title for bootcamp in bootcamp_service.list_bootcamps()] == ["Third", "Second", "First"]
+
+
+@pytest.mark.sqlmodel
+def test_get_or_create_tags_reuses_existing_tags(clean_db):
+    with get_session() as session:
+        first = bootcamp_service.get_or_create_tags(session, ["python", "sql"])
+        second = bootcamp_service.get_or_create_tags(session, ["sql", "rust", "sql"])
+        session.commit()
+
+        assert [tag.name for tag in second] == ["sql", "rust"]
+        assert second[0].id == first[1].id
+        assert len(session.exec(select(Tag)).all()) == 3
+
+
+@pytest.mark.sqlmodel
+def test_get_bootcamp_tree_loads_every_level(clean_db):
+    bootcamp = bootcamp_service.get_bootcamp_tree(_seed_bootcamp())
+
+    assert bootcamp is not None
+    assert [len(course.lessons) for course in bootcamp.courses] == [1, 2]
+    assert all(lesson.materials == [] and lesson.quizzes == [] for lesson in bootcamp.courses[1].lessons)
+
+
+@pytest.mark.sqlmodel
+def test_loading_a_child_does_not_load_its_parents(clean_db):
+    course_id = bootcamp_service.list_courses(_seed_bootcamp()).items[0].id
+    with get_session() as session:
+        lesson = session.exec(select(Lesson).where(Lesson.course_id == course_id)).one()
+        assert lesson.id is not None
+        material = LearningMaterial(lesson_id=lesson.id, title="Slides", order_index=0)
+        session.add(material)
+        session.commit()
+        material_id = material.id
+
+    with get_session() as session:
+        loaded = session.get(LearningMaterial, material_id)
+
+        assert loaded is not None
+        assert "lesson" in instance_state(loaded).unloaded
+
+
+@pytest.mark.sqlmodel
+@pytest.mark.skipif(not STRICT_LOADING, reason="strict loading disabled")
+def test_unrequested_relationship_raises_in_strict_mode(clean_db):
+    bootcamp_id = _seed_bootcamp()
+    with get_session() as session:
+        bootcamp = session.exec(select(Bootcamp).where(Bootcamp.id == bootcamp_id).options(*explicit_loads())).one()
+
+        with pytest.raises(InvalidRequestError):
+            _ = bootcamp.courses
+
+
+@pytest.mark.sqlmodel
+def test_list_courses_counts_lessons(clean_db):
+    bootcamp_id = _seed_bootcamp()
+
+    page = bootcamp_service.list_courses(bootcamp_id)
+
+    assert [course.title for course in page.items] == ["Course 0", "Course 1"]
+    assert [course.lessons_count for course in page.items] == [1, 2]
+    assert page.next_cursor is None
+
+
+@pytest.mark.sqlmodel
+def test_list_lessons_pages_by_keyset(clean_db):
+    course_id = bootcamp_service.list_courses(_seed_bootcamp()).items[0].id
+    with get_session() as session:
+        # duplicate order_index values: ties are broken by id
+        for index in range(5):
+            session.add(Lesson(course_id=course_id, title=f"Extra {index}", order_index=1))
+        session.commit()
+
+    titles = []
+    page = bootcamp_service.list_lessons(course_id, limit=2)
+    titles.extend(lesson.title for lesson in page.items)
+    while page.next_cursor is not None:
+        cursor = page.next_cursor
+        page = bootcamp_service.list_lessons(course_id, cursor.order_index, cursor.id, limit=2)
+        assert len(page.items) <= 2
+        titles.extend(lesson.title for lesson in page.items)
+
+    assert titles == ["Lesson 0"] + [f"Extra {index}" for index in range(5)]
+    assert not hasattr(page.items[0], "content")
+
+
+def test_keyset_page_seeks_past_the_cursor():
+    query = bootcamp_service._keyset_page(select(Lesson).where(Lesson.course_id == 1), Lesson, 2, 5, page_size=10)
+
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    assert "(lessons.order_index, lessons.id) > (2, 5)" in sql
+    assert "ORDER BY lessons.order_index ASC, lessons.id ASC" in sql
+    assert "OFFSET" not in sql
+    assert sql.endswith("LIMIT 11")  # one extra row tells whether there is a next page
+
+
+@pytest.mark.parametrize("cursor", [{"after_order": 3}, {"after_id": 7}])
+def test_list_lessons_rejects_half_a_cursor(cursor):
+    # raised while building the query, before any database round trip
+    with pytest.raises(ValueError):
+        bootcamp_service.list_lessons(1, **cursor)
+
+
+@pytest.mark.parametrize("listing", [bootcamp_service.list_courses, bootcamp_service.list_lessons])
+@pytest.mark.parametrize("limit", [0, -1])
+def test_listings_reject_empty_pages(listing, limit):
+    with pytest.raises(ValueError):
+        listing(1, limit=limit)
+
+
+@pytest.mark.sqlmodel
+def test_iter_bootcamp_lessons_streams_in_course_order(clean_db):
+    bootcamp_id = _seed_bootcamp()
+
+    lessons = list(bootcamp_service.iter_bootcamp_lessons(bootcamp_id))
+
+    assert [lesson.title for lesson in lessons] == ["Lesson 0", "Lesson 0", "Lesson 1"]
+    assert all(lesson.content == "" for lesson in lessons)
+
+
+@pytest.mark.sqlmodel
+def test_get_lesson_counts_children(clean_db):
+    course_id = bootcamp_service.list_courses(_seed_bootcamp()).items[0].id
+    with get_session() as session:
+        lesson = Lesson(course_id=course_id, title="Detailed", order_index=5)
+        session.add(lesson)
+        session.commit()
+        session.refresh(lesson)
+        assert lesson.id is not None
+        lesson_id = lesson.id
+        session.add(LearningMaterial(lesson_id=lesson_id, title="Slides", order_index=0))
+        session.add(LearningMaterial(lesson_id=lesson_id, title="Notes", order_index=1))
+        session.add(Quiz(lesson_id=lesson_id, title="Check", order_index=0))
+        session.commit()
+
+    lesson_detail = bootcamp_service.get_lesson(lesson_id)
+
+    assert lesson_detail is not None
+    assert lesson_detail.materials_count == 2
+    assert lesson_detail.quizzes_count == 1
+
+
+@pytest.mark.sqlmodel
+def test_bootcamp_response_encodes_enum_values(clean_db):
+    bootcamp = bootcamp_service.get_bootcamp(_seed_bootcamp())
+    assert bootcamp is not None
+
+    payload = json.loads(msgspec.json.encode(bootcamp))
+
+    assert payload["difficulty_level"] == "intermediate"
+    assert payload["generation_status"] == "pending"
+    assert payload["created_at"] == bootcamp.created_at.isoformat()
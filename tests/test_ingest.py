@@ -0,0 +1,228 @@
+import json
+
+import pytest
+from sqlalchemy import Integer, cast, delete, insert, update
+from sqlmodel import asc, col, select
+
+from app.database import get_session
+from app.ingest import (
+    _INSERT_QUESTIONS_FROM_JSON,
+    bulk_insert,
+    copy_questions,
+    insert_materials,
+    insert_questions_from_json,
+    questions_to_csv,
+)
+from app.models import Bootcamp, Course, LearningMaterial, Lesson, Question, QuestionType, Quiz, choice_codes
+
+
+def _seed_course() -> int:
+    with get_session() as session:
+        bootcamp = Bootcamp(title="Data Bootcamp", topic="data")
+        session.add(bootcamp)
+        session.commit()
+        session.refresh(bootcamp)
+        assert bootcamp.id is not None
+        course = Course(bootcamp_id=bootcamp.id, title="SQL", order_index=0)
+        session.add(course)
+        session.commit()
+        session.refresh(course)
+        assert course.id is not None
+        return course.id
+
+
+@pytest.mark.sqlmodel
+def test_bulk_insert_fills_defaults_in_batches(clean_db):
+    course_id = _seed_course()
+    rows = [{"course_id": course_id, "title": f"Lesson {index}", "order_index": index} for index in range(5)]
+
+    with get_session() as session:
+        assert bulk_insert(session, Lesson, rows, batch_size=2) == 5
+        session.commit()
+
+        lessons = session.exec(select(Lesson).order_by(asc(Lesson.order_index))).all()
+
+    assert [lesson.title for lesson in lessons] == [f"Lesson {index}" for index in range(5)]
+    assert all(lesson.content == "" and lesson.key_concepts == [] for lesson in lessons)
+    assert all(lesson.created_at is not None for lesson in lessons)
+
+
+@pytest.mark.sqlmodel
+def test_child_counters_follow_inserts_updates_and_deletes(clean_db):
+    course_id = _seed_course()
+    rows = [{"course_id": course_id, "title": f"Lesson {index}", "order_index": index} for index in range(3)]
+
+    with get_session() as session:
+        course = session.get(Course, course_id)
+        assert course is not None
+        other = Course(bootcamp_id=course.bootcamp_id, title="Other", order_index=1)
+        session.add(other)
+        bulk_insert(session, Lesson, rows)
+        session.commit()
+        assert other.id is not None
+        first, second = session.exec(select(Lesson).where(col(Lesson.order_index) < 2)).all()
+        session.delete(first)
+        second.course_id = other.id
+        session.add(Quiz(title="Standalone", order_index=0))  # no lesson: counts nowhere
+        session.commit()
+
+        counts = {course.title: course.lessons_count for course in session.exec(select(Course)).all()}
+
+    assert counts == {"SQL": 1, "Other": 1}
+
+
+@pytest.mark.sqlmodel
+def test_child_counters_move_by_whole_statements(clean_db):
+    course_id = _seed_course()
+
+    with get_session() as session:
+        course = session.get(Course, course_id)
+        assert course is not None
+        other = Course(bootcamp_id=course.bootcamp_id, title="Other", order_index=1)
+        session.add(other)
+        session.commit()
+        assert other.id is not None
+
+        def counts() -> dict:
+            session.expire_all()
+            return {course.title: course.lessons_count for course in session.exec(select(Course)).all()}
+
+        # each statement touches many rows across both parents at once
+        rows = [{"course_id": course_id, "title": f"Lesson {index}", "order_index": index} for index in range(4)]
+        session.execute(insert(Lesson).values(rows + [{**rows[0], "course_id": other.id}]))
+        assert counts() == {"SQL": 4, "Other": 1}
+        session.execute(update(Lesson).where(col(Lesson.order_index) < 3).values(course_id=other.id))
+        assert counts() == {"SQL": 1, "Other": 4}
+        session.execute(delete(Lesson).where(col(Lesson.order_index) > 0))
+        assert counts() == {"SQL": 0, "Other": 2}
+        session.commit()
+
+
+@pytest.mark.sqlmodel
+def test_insert_materials_stores_promoted_columns(clean_db):
+    course_id = _seed_course()
+    with get_session() as session:
+        lesson = Lesson(course_id=course_id, title="Joins", order_index=0)
+        session.add(lesson)
+        session.commit()
+        session.refresh(lesson)
+        assert lesson.id is not None
+
+        rows = [
+            {
+                "lesson_id": lesson.id,
+                "title": "Video",
+                "order_index": 0,
+                "material_metadata": {"language": "en", "fps": 30},
+            }
+        ]
+        assert insert_materials(session, rows) == 1
+        session.commit()
+
+        material = session.exec(select(LearningMaterial)).one()
+
+    assert material.language == "en"
+    assert material.duration_seconds is None
+    assert material.material_metadata == {"fps": 30}
+
+
+def _seed_quiz() -> int:
+    with get_session() as session:
+        quiz = Quiz(title="Checkpoint", order_index=0)
+        session.add(quiz)
+        session.commit()
+        session.refresh(quiz)
+        assert quiz.id is not None
+        return quiz.id
+
+
+@pytest.mark.sqlmodel
+def test_copy_questions_round_trips_through_orm(clean_db):
+    quiz_id = _seed_quiz()
+    with get_session() as session:
+        rows = [
+            {
+                "quiz_id": quiz_id,
+                "question_text": 'Which keyword defines a function, "def" or "fn"?',
+                "options": ["def", "fn"],
+                "correct_answers": ["def"],
+                "order_index": 0,
+            },
+            {
+                "quiz_id": quiz_id,
+                "question_text": "Explain generators.",
+                "question_type": "essay",
+                "difficulty_level": "advanced",
+                "points": 5,
+                "order_index": 1,
+                "tags": ["python"],
+            },
+        ]
+        assert copy_questions(session, rows) == 2
+        session.commit()
+
+        questions = session.exec(select(Question).order_by(asc(Question.order_index))).all()
+        # cast to Integer so the raw storage codes come back instead of ChoiceCode's string values
+        codes = session.exec(
+            select(cast(col(Question.question_type), Integer)).order_by(asc(Question.order_index))
+        ).all()
+
+    assert questions[0].question_text == 'Which keyword defines a function, "def" or "fn"?'
+    assert questions[0].question_type == "multiple_choice"
+    assert questions[0].options == ["def", "fn"]
+    assert questions[0].explanation == ""
+    assert questions[1].question_type == QuestionType.ESSAY
+    assert questions[1].difficulty_level == "advanced"
+    assert questions[1].tags == ["python"]
+    assert codes == [
+        choice_codes(QuestionType)[QuestionType.MULTIPLE_CHOICE],
+        choice_codes(QuestionType)[QuestionType.ESSAY],
+    ]
+
+
+@pytest.mark.sqlmodel
+def test_insert_questions_from_json_applies_defaults(clean_db):
+    quiz_id = _seed_quiz()
+    raw_json = json.dumps(
+        [
+            {"quiz_id": quiz_id, "question_text": "2 + 2?", "options": ["3", "4"], "order_index": 0},
+            {
+                "quiz_id": quiz_id,
+                "question_text": "Is Python compiled?",
+                "question_type": "true_false",
+                "difficulty_level": "intermediate",
+                "order_index": 1,
+            },
+        ]
+    )
+
+    with get_session() as session:
+        assert insert_questions_from_json(session, raw_json) == 2
+        session.commit()
+
+        questions = session.exec(select(Question).order_by(asc(Question.order_index))).all()
+
+    assert questions[0].options == ["3", "4"]
+    assert questions[0].points == 1
+    assert questions[0].question_type == "multiple_choice"
+    assert questions[1].question_type == "true_false"
+    assert questions[1].difficulty_level == "intermediate"
+    assert questions[1].tags == []
+
+
+def test_questions_to_csv_quotes_every_field_and_encodes_choices():
+    buffer, count = questions_to_csv(
+        [{"quiz_id": 1, "question_text": 'Say "hi"', "question_type": QuestionType.ESSAY, "order_index": 0}]
+    )
+
+    assert count == 1
+    # empty strings stay quoted ("" is not NULL in COPY CSV), JSON columns are dumped, choices become codes
+    assert buffer.read() == '"1","Say ""hi""","4","[]","[]","","1","0","1","[]"\r\n'
+
+
+def test_insert_questions_from_json_maps_choice_names_to_codes():
+    sql = str(_INSERT_QUESTIONS_FROM_JSON)
+
+    assert "jsonb_to_recordset(CAST(:payload AS jsonb))" in sql
+    assert "CASE coalesce(q.question_type, 'multiple_choice') WHEN 'multiple_choice' THEN 1" in sql
+    assert "WHEN 'advanced' THEN 3" in sql
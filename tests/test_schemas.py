@@ -0,0 +1,137 @@
+import json
+import subprocess
+import sys
+from datetime import datetime
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from app.models import (
+    Bootcamp,
+    BootcampCreate,
+    Course,
+    DifficultyLevel,
+    GenerationStatus,
+    LearningMaterialCreate,
+    MaterialType,
+    QuestionCreate,
+    QuestionType,
+    Tag,
+    choice_codes,
+    choice_names,
+    get_type_adapter,
+    validate,
+    validate_many,
+)
+from app.schemas_fast import bootcamp_response, course_response
+
+
+def test_validate_returns_schema_instance():
+    bootcamp = validate(BootcampCreate, {"title": "Rust", "topic": "rust", "tags": ["systems"]})
+
+    assert isinstance(bootcamp, BootcampCreate)
+    assert bootcamp.difficulty_level == "beginner"
+    assert bootcamp.tags == ["systems"]
+
+
+def test_validate_enforces_constraints():
+    with pytest.raises(ValidationError):
+        validate(QuestionCreate, {"quiz_id": 1, "question_text": "Why?", "order_index": 0, "points": 11})
+
+
+def test_validate_limits_tag_length():
+    with pytest.raises(ValidationError):
+        validate(BootcampCreate, {"title": "Rust", "topic": "rust", "tags": ["x" * 101]})
+
+
+def test_material_metadata_keys_are_promoted_and_validated():
+    material = validate(
+        LearningMaterialCreate,
+        {"lesson_id": 1, "title": "Video", "order_index": 0, "material_metadata": {"duration_seconds": 300, "fps": 30}},
+    )
+
+    assert material.duration_seconds == 300
+    assert material.material_metadata == {"fps": 30}
+    with pytest.raises(ValidationError):
+        validate(
+            LearningMaterialCreate,
+            {"lesson_id": 1, "title": "Video", "order_index": 0, "material_metadata": {"language": "x" * 80}},
+        )
+
+
+def test_material_metadata_conflicts_stay_in_overflow():
+    material = validate(
+        LearningMaterialCreate,
+        {"lesson_id": 1, "title": "Video", "order_index": 0, "language": "de", "material_metadata": {"language": "en"}},
+    )
+
+    assert material.language == "de"
+    assert material.material_metadata == {"language": "en"}
+
+
+def test_type_adapters_are_cached():
+    assert get_type_adapter(QuestionCreate) is get_type_adapter(QuestionCreate)
+
+
+def test_bootcamp_response_is_built_without_validation():
+    now = datetime(2025, 1, 1, 12, 0)
+    bootcamp = Bootcamp(id=7, title="Go", topic="go", tags=[Tag(name="backend")], created_at=now, updated_at=now)
+
+    response = bootcamp_response(bootcamp)
+    payload = json.loads(msgspec.json.encode(response))
+
+    assert response.id == 7
+    assert payload["tags"] == ["backend"]
+    assert payload["created_at"] == "2025-01-01T12:00:00"
+
+
+def test_responses_require_persisted_rows():
+    with pytest.raises(ValueError):
+        course_response(Course(title="Intro", bootcamp_id=7, order_index=0))
+
+
+def test_choice_fields_accept_enum_members_and_reject_unknown_values():
+    question = validate(
+        QuestionCreate, {"quiz_id": 1, "question_text": "?", "order_index": 0, "question_type": "essay"}
+    )
+    bootcamp = validate(BootcampCreate, {"title": "Go", "topic": "go", "difficulty_level": DifficultyLevel.ADVANCED})
+
+    assert question.question_type == "essay"
+    assert bootcamp.difficulty_level == DifficultyLevel.ADVANCED == "advanced"
+    with pytest.raises(ValidationError):
+        validate(BootcampCreate, {"title": "Go", "topic": "go", "difficulty_level": "expert"})
+
+
+@pytest.mark.parametrize("choices", [DifficultyLevel, GenerationStatus, MaterialType, QuestionType])
+def test_every_choice_has_a_storage_code(choices):
+    codes = choice_codes(choices)
+
+    assert set(codes) == {member.value for member in choices}
+    assert len(set(codes.values())) == len(codes)
+    assert {choice_names(choices)[codes[member]] for member in choices} == set(codes)
+
+
+def test_responses_are_frozen():
+    response = course_response(Course(id=3, bootcamp_id=7, title="Intro", order_index=0, lessons_count=4))
+
+    assert response.lessons_count == 4
+    with pytest.raises(AttributeError):
+        response.lessons_count = 5  # type: ignore[misc]
+
+
+def test_validate_many_validates_the_whole_batch():
+    payloads = [{"quiz_id": 1, "question_text": f"Q{index}", "order_index": index} for index in range(3)]
+
+    questions = validate_many(QuestionCreate, payloads)
+
+    assert [question.order_index for question in questions] == [0, 1, 2]
+    assert all(isinstance(question, QuestionCreate) for question in questions)
+    with pytest.raises(ValidationError):
+        validate_many(QuestionCreate, [*payloads, {"quiz_id": 1, "question_text": "Q", "order_index": -1}])
+
+
+def test_enums_import_without_orm():
+    code = "import sys, app.enums; assert 'sqlalchemy' not in sys.modules and 'pydantic' not in sys.modules"
+
+    subprocess.run([sys.executable, "-c", code], check=True)